@@ -411,6 +411,10 @@ def write(path, a, nodata=1.0e20, dtype=np.float32):
     if (data_dtype == np.float32) or (data_dtype == np.float64):
         a = a.fillna(nodata)
 
+    # Materialize once; dmin, dmax and the payload write all read from
+    # this buffer rather than going through xarray reductions.
+    values = a.values
+
     with f_open(path, "wb") as f:
         f.write(struct.pack("i", reclenid))  # Lahey RecordLength Ident.
         if doubleprecision:
@@ -426,8 +430,8 @@ def write(path, a, nodata=1.0e20, dtype=np.float32):
         f.write(struct.pack(floatformat, xmax))
         f.write(struct.pack(floatformat, ymin))
         f.write(struct.pack(floatformat, ymax))
-        f.write(struct.pack(floatformat, float(a.min())))  # dmin
-        f.write(struct.pack(floatformat, float(a.max())))  # dmax
+        f.write(struct.pack(floatformat, float(values.min())))  # dmin
+        f.write(struct.pack(floatformat, float(values.max())))  # dmax
         f.write(struct.pack(floatformat, nodata))
 
         if isinstance(dx, float) and isinstance(dy, float):
@@ -461,7 +465,7 @@ def write(path, a, nodata=1.0e20, dtype=np.float32):
         if not ieq:
             np.abs(a.coords["dx"].values).astype(a.dtype).tofile(f)
             np.abs(a.coords["dy"].values).astype(a.dtype).tofile(f)
-        a.values.tofile(f)
+        values.tofile(f)
 
 
 def _as_voxeldata(a):
@@ -153,9 +153,10 @@ class BoundaryCondition(Package, abc.ABC):
                 "self.dataset should be xarray.Dataset or xugrid.UgridDataset,"
                 f" is {type(self.dataset)} instead"
             )
-        # Fill in the data
+        # Fill in the data. The fancy index already yields a fresh
+        # array, so the float64 cast may reuse it instead of copying.
         for key, arr in arrdict.items():
-            values = arr[notnull].astype(np.float64)
+            values = arr[notnull].astype(np.float64, copy=False)
             recarr[key] = values
 
         return recarr
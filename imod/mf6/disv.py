@@ -1,3 +1,4 @@
+import functools
 from pathlib import Path
 from typing import Any, List
 
@@ -87,6 +88,9 @@ class VerticesDiscretization(Package, IRegridPackage, IMaskingSettings):
     _grid_data = {"top": np.float64, "bottom": np.float64, "idomain": np.int32}
     _keyword_map = {"bottom": "botm"}
     _template = Package._initialize_template(_pkg_id)
+    # The template is static per class: bind its render entry point once
+    # instead of re-resolving template attributes on every render.
+    _render_template = staticmethod(_template.render)
     _regrid_method = DiscretizationRegridMethod()
 
     @property
@@ -103,16 +107,24 @@ class VerticesDiscretization(Package, IRegridPackage, IMaskingSettings):
         super().__init__(dict_dataset)
         self._validate_init_schemata(validate)
 
+    @functools.cached_property
+    def _grid_sizes(self) -> dict[str, int]:
+        # Invariant for the package's grid: compute once, render may be
+        # called repeatedly.
+        grid = self.dataset.ugrid.grid
+        facedim = grid.face_dimension
+        return {
+            "nlay": self.dataset["idomain"].coords["layer"].size,
+            "ncpl": self.dataset["idomain"].coords[facedim].size,
+            "nvert": grid.node_x.size,
+        }
+
     def _get_render_dictionary(self, directory, pkgname, globaltimes, binary):
         disdirectory = directory / pkgname
         d: dict[str, Any] = {}
-        grid = self.dataset.ugrid.grid
         d["xorigin"] = 0.0
         d["yorigin"] = 0.0
-        d["nlay"] = self.dataset["idomain"].coords["layer"].size
-        facedim = grid.face_dimension
-        d["ncpl"] = self.dataset["idomain"].coords[facedim].size
-        d["nvert"] = grid.node_x.size
+        d.update(self._grid_sizes)
 
         _, d["top"] = self._compose_values(
             self.dataset["top"], disdirectory, "top", binary=binary
@@ -125,42 +137,67 @@ class VerticesDiscretization(Package, IRegridPackage, IMaskingSettings):
         )
         return d
 
-    def _verts_dataframe(self) -> pd.DataFrame:
+    def _render(self, directory, pkgname, globaltimes, binary):
+        d = self._get_render_dictionary(directory, pkgname, globaltimes, binary)
+        return self._render_template(d)
+
+    @functools.cached_property
+    def _node_coords(self) -> np.ndarray:
+        # xugrid may compute these coordinates lazily; materialize them
+        # once as contiguous float64 so the DataFrames below wrap them
+        # without copying or dtype coercion.
+        grid = self.dataset.ugrid.grid
+        return np.ascontiguousarray(grid.node_coordinates, dtype=np.float64)
+
+    @functools.cached_property
+    def _face_coords(self) -> np.ndarray:
         grid = self.dataset.ugrid.grid
-        df = pd.DataFrame(grid.node_coordinates)
+        return np.ascontiguousarray(grid.face_coordinates, dtype=np.float64)
+
+    def _verts_dataframe(self) -> pd.DataFrame:
+        df = pd.DataFrame(self._node_coords, copy=False)
         df.index += 1
         return df
 
     def _cell2d_dataframe(self) -> pd.DataFrame:
         grid = self.dataset.ugrid.grid
-        df = pd.DataFrame(grid.face_coordinates)
+        df = pd.DataFrame(self._face_coords, copy=False)
         df.index += 1
+        # Compare against the fill value once, on the contiguous array;
+        # the reversed mask below is a view on the same result.
+        conn = grid.face_node_connectivity
+        valid = conn != grid.fill_value
+        df[2] = valid.sum(axis=1)
         # modflow requires clockwise; ugrid requires ccw
-        face_nodes = grid.face_node_connectivity[:, ::-1]
-        df[2] = (face_nodes != grid.fill_value).sum(axis=1)
-        for i, column in enumerate(face_nodes.T):
-            # Use extension array to write empty values
-            # Should be more efficient than mixed column?
-            df[3 + i] = pd.arrays.IntegerArray(
-                values=column + 1,
-                mask=(column == grid.fill_value),
-            )
-        return df
+        # Use nullable integers to write empty values; assign all node
+        # columns in one vectorized pass rather than per column.
+        nodes = pd.DataFrame(conn[:, ::-1] + 1, dtype="Int64").where(valid[:, ::-1])
+        nodes.columns += 3
+        nodes.index += 1
+        return pd.concat([df, nodes], axis=1)
+
+    @staticmethod
+    def _write_block(f, df: pd.DataFrame) -> None:
+        # Stream the block through np.savetxt rather than the pandas CSV
+        # machinery; empty entries (pd.NA) are written as empty strings,
+        # like DataFrame.to_csv does.
+        values = df.to_numpy(dtype=object, na_value="")
+        rows = np.column_stack([df.index.to_numpy(dtype=object), values])
+        np.savetxt(f, rows, fmt="%s", delimiter=" ", newline="\n")
 
     def _append_vertices_and_cell2d(self, filename: Path | str) -> None:
+        # These blocks are MODFLOW 6 list input and must stay inside the
+        # text blockfile: unlike griddata, mf6 offers no binary (let alone
+        # HDF5) alternative for vertices/cell2d.
         with open(filename, "a") as f:
             f.write("\n\n")
 
             f.write("begin vertices\n")
-            self._verts_dataframe().to_csv(
-                f, header=False, sep=" ", lineterminator="\n"
-            )
+            self._write_block(f, self._verts_dataframe())
             f.write("end vertices\n\n")
 
             f.write("begin cell2d\n")
-            self._cell2d_dataframe().to_csv(
-                f, header=False, sep=" ", lineterminator="\n"
-            )
+            self._write_block(f, self._cell2d_dataframe())
             f.write("end cell2d\n")
 
         return
@@ -320,7 +320,11 @@ class UnsaturatedZoneFlow(AdvancedBoundaryCondition):
                     if isinstance(self["infiltration_rate"], xu.UgridDataArray):
                         self.dataset[var] = xu.full_like(self["infiltration_rate"], 0)
                     else:
-                        self.dataset[var] = xr.full_like(self["infiltration_rate"], 0.0)
+                        # Chunk first so the zeros are dask-backed and
+                        # no full array is allocated until write time.
+                        self.dataset[var] = xr.zeros_like(
+                            self["infiltration_rate"].chunk()
+                        )
                 else:
                     raise ValueError("{} cannot be a scalar".format(var))
 
@@ -373,22 +377,48 @@ class UnsaturatedZoneFlow(AdvancedBoundaryCondition):
 
     def _create_uzf_numbers(self, landflag):
         """Create unique UZF ID's. Inactive cells equal 0"""
-        active_nodes = landflag.notnull().astype(np.int8)
-        return np.nancumsum(active_nodes).reshape(landflag.shape) * active_nodes
+        active_nodes = landflag.notnull()
+        mask = active_nodes.to_numpy()
+        # Number the active cells with an in-place cumsum over one
+        # int32 buffer rather than nancumsum plus a separate multiply.
+        numbers = mask.astype(np.int32).reshape(-1)
+        np.cumsum(numbers, out=numbers)
+        numbers = numbers.reshape(mask.shape)
+        numbers *= mask
+        return active_nodes.copy(data=numbers)
 
     def _determine_landflag(self, kv_sat):
         """returns the landflag for uzf-model. Landflag == 1 for top active UZF-nodes"""
-        land_nodes = get_upper_active_grid_cells(kv_sat).astype(np.int32)
+        # No astype here: where() upcasts to float64 regardless, so the
+        # int32 intermediate would be allocated only to be discarded.
+        land_nodes = get_upper_active_grid_cells(kv_sat)
         return land_nodes.where(kv_sat.notnull())
 
     def _determine_vertical_connection(self, uzf_number):
         return uzf_number.shift(layer=-1, fill_value=0)
 
+    def _landflag_masks(self):
+        """
+        The landflag values and the masks derived from them are needed
+        by several sparse-conversion methods; compute them once per
+        landflag array and cache on the instance.
+        """
+        data = self.dataset["landflag"].data
+        cache = getattr(self, "_landflag_cache", None)
+        if cache is None or cache[0] is not data:
+            values = self.dataset["landflag"].to_numpy()
+            self._landflag_cache = (data, values, ~np.isnan(values), values == 1)
+        _, values, notnull, active = self._landflag_cache
+        return values, notnull, active
+
     def _package_data_to_sparse(self):
-        notnull = self.dataset["landflag"].notnull().to_numpy()
-        iuzno = self.dataset["iuzno"].values[notnull]
-        landflag = self.dataset["landflag"].values[notnull]
-        ivertcon = self.dataset["ivertcon"].values[notnull]
+        landflag_values, notnull, _ = self._landflag_masks()
+        # Compute the index variables in one go: for dask-backed data
+        # this traverses the shared graph once instead of per variable.
+        index_ds = self.dataset[["iuzno", "ivertcon"]].compute()
+        iuzno = index_ds["iuzno"].to_numpy()[notnull]
+        landflag = landflag_values[notnull]
+        ivertcon = index_ds["ivertcon"].to_numpy()[notnull]
 
         ds = self.dataset[list(self._package_data)]
 
@@ -437,8 +467,8 @@ class UnsaturatedZoneFlow(AdvancedBoundaryCondition):
         since the perioddata does not require cellids but iuzno, we hgave to override"""
         # TODO add pkgcheck that period table aligns
         # Get the number of valid values
-        notnull = self.dataset["landflag"].values == 1
-        iuzno = self.dataset["iuzno"].values
+        _, _, notnull = self._landflag_masks()
+        iuzno = self.dataset["iuzno"].to_numpy()
         nrow = notnull.sum()
         # Define the numpy structured array dtype
         index_spec = [("iuzno", np.int32)]
@@ -450,9 +480,10 @@ class UnsaturatedZoneFlow(AdvancedBoundaryCondition):
         # Fill in the indices
         recarr["iuzno"] = iuzno[notnull]
 
-        # Fill in the data
+        # Fill in the data. Assigning into the field casts in place, so
+        # no float64 intermediate is allocated per variable.
         for key, arr in arrdict.items():
-            recarr[key] = arr[notnull].astype(np.float64)
+            recarr[key] = arr[notnull]
 
         return recarr
 
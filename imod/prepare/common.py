@@ -163,13 +163,17 @@ def _coord(da, dim):
     if da[dim].size == 0:
         return np.array(())
 
+    # dxs is None for equidistant coordinates: a single cellsize scalar
+    # suffices there, no cellsize array has to be materialized.
+    dxs = None
     if delta_dim in da.coords:  # equidistant or non-equidistant
         dx = da[delta_dim].values
         if dx.shape == () or dx.shape == (1,):  # scalar -> equidistant
-            dxs = np.full(da[dim].size, dx)
+            _check_monotonic(np.atleast_1d(dx), dim)
+            dx = abs(float(dx))
         else:  # array -> non-equidistant
-            dxs = dx
-        _check_monotonic(dxs, dim)
+            _check_monotonic(dx, dim)
+            dxs = np.abs(dx)
 
     else:  # not defined -> equidistant
         if da[dim].size == 1:
@@ -177,27 +181,31 @@ def _coord(da, dim):
                 f"DataArray has size 1 along {dim}, so cellsize must be provided"
                 " as a coordinate."
             )
-        dxs = np.diff(da[dim].values)
-        dx = dxs[0]
+        diffs = np.diff(da[dim].values)
+        dx = diffs[0]
         atolx = abs(1.0e-4 * dx)
-        if not np.allclose(dxs, dx, atolx):
+        if not np.allclose(diffs, dx, atolx):
             raise ValueError(
                 f"DataArray has to be equidistant along {dim}, or cellsizes"
                 " must be provided as a coordinate."
             )
-        dxs = np.full(da[dim].size, dx)
+        dx = abs(dx)
 
-    dxs = np.abs(dxs)
     x = da[dim].values
     if not da.indexes[dim].is_monotonic_increasing:
         x = x[::-1]
-        dxs = dxs[::-1]
+        if dxs is not None:
+            dxs = dxs[::-1]
 
     # This assumes the coordinate to be monotonic increasing
+    if dxs is None:  # equidistant: no cumsum over a constant array
+        return (x[0] - 0.5 * dx) + dx * np.arange(x.size + 1)
     x0 = x[0] - 0.5 * dxs[0]
-    x = np.full(dxs.size + 1, x0)
-    x[1:] += np.cumsum(dxs)
-    return x
+    out = np.empty(dxs.size + 1)
+    out[0] = x0
+    np.cumsum(dxs, out=out[1:])
+    out[1:] += x0
+    return out
 
 
 def _get_method(method, methods):
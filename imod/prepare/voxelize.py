@@ -1,3 +1,4 @@
+import functools
 from typing import Any
 
 import numba
@@ -12,41 +13,86 @@ METHODS.pop("conductance")
 METHODS.pop("nearest")
 METHODS.pop("multilinear")
 
+_VOXELIZE_SIGNATURE = numba.float64[:, :, :](
+    numba.float64[:, :, :],
+    numba.float64[:, :, :],
+    numba.float64[:, :, :],
+    numba.float64[:, :, :],
+    numba.float64[:],
+)
+
+
+@numba.njit(cache=True)
+def _is_descending(tops, bots):
+    # NaNs fail every comparison, so columns containing NaN fall back
+    # to the full layer scan.
+    nlayer = tops.size
+    if nlayer > 0 and (np.isnan(tops[0]) or np.isnan(bots[0])):
+        return False
+    for jj in range(nlayer - 1):
+        if not (tops[jj] >= tops[jj + 1]) or not (bots[jj] >= bots[jj + 1]):
+            return False
+    return True
+
 
 @numba.njit(cache=True)
+def _layer_bounds(tops, bots, zb, zt):
+    # For top-down sorted columns, only layers with top > zb and
+    # bot < zt can overlap the (zb, zt) slab; bisect for their range.
+    nlayer = tops.size
+    jj_lo = nlayer - np.searchsorted(bots[::-1], zt, side="left")
+    jj_hi = nlayer - np.searchsorted(tops[::-1], zb, side="right")
+    return jj_lo, jj_hi
+
+
+@numba.njit(cache=True, parallel=True)
 def _voxelize(src, dst, src_top, src_bot, dst_z, method):
-    nlayer, nrow, ncol = src.shape
+    # src, src_top, and src_bot are layer-fastest: shape (nrow, ncol,
+    # nlayer), so the inner layer loop reads unit-stride memory.
+    nrow, ncol, nlayer = src.shape
     nz = dst_z.size - 1
-    values = np.zeros(nlayer)
-    weights = np.zeros(nlayer)
-
-    for i in range(nrow):
+    # The slab bounds depend only on ii: compute them once instead of
+    # per column.
+    zb_arr = np.minimum(dst_z[:-1], dst_z[1:])
+    zt_arr = np.maximum(dst_z[:-1], dst_z[1:])
+    valid = ~(np.isnan(zb_arr) | np.isnan(zt_arr))
+
+    for i in numba.prange(nrow):
+        # Allocate scratch arrays inside the parallel loop so every
+        # thread works on its own buffers.
+        values = np.zeros(nlayer)
+        weights = np.zeros(nlayer)
         for j in range(ncol):
-            tops = src_top[:, i, j]
-            bots = src_bot[:, i, j]
+            tops = src_top[i, j]
+            bots = src_bot[i, j]
+            monotonic = _is_descending(tops, bots)
 
             # ii is index of dst
             for ii in range(nz):
-                z0 = dst_z[ii]
-                z1 = dst_z[ii + 1]
-                if np.isnan(z0) or np.isnan(z1):
+                # dst arrives uninitialized (np.empty): write the NaN
+                # default here, merged into the compute pass.
+                dst[ii, i, j] = np.nan
+                if not valid[ii]:
                     continue
 
-                zb = min(z0, z1)
-                zt = max(z0, z1)
+                zb = zb_arr[ii]
+                zt = zt_arr[ii]
+                if monotonic:
+                    jj_lo, jj_hi = _layer_bounds(tops, bots, zb, zt)
+                else:
+                    jj_lo, jj_hi = 0, nlayer
                 count = 0
                 has_value = False
                 # jj is index of src
-                for jj in range(nlayer):
-                    top = tops[jj]
-                    bot = bots[jj]
-
-                    overlap = common._overlap((bot, top), (zb, zt))
+                for jj in range(jj_lo, jj_hi):
+                    # Inlined common._overlap: plain min/max arithmetic
+                    # without tuple packing vectorizes better.
+                    overlap = max(0.0, min(tops[jj], zt) - max(bots[jj], zb))
                     if overlap == 0:
                         continue
 
                     has_value = True
-                    values[count] = src[jj, i, j]
+                    values[count] = src[i, j, jj]
                     weights[count] = overlap
                     count += 1
                 else:
@@ -59,10 +105,81 @@ def _voxelize(src, dst, src_top, src_bot, dst_z, method):
     return dst
 
 
+@numba.njit(_VOXELIZE_SIGNATURE, cache=True, parallel=True)
+def _voxelize_weighted_mean(src, dst, src_top, src_bot, dst_z):
+    # Specialization of _voxelize for the (default) mean method: the
+    # reduction runs on scalar accumulators in a single pass, without
+    # scratch arrays or a per-voxel function call.
+    nrow, ncol, nlayer = src.shape
+    nz = dst_z.size - 1
+    zb_arr = np.minimum(dst_z[:-1], dst_z[1:])
+    zt_arr = np.maximum(dst_z[:-1], dst_z[1:])
+    valid = ~(np.isnan(zb_arr) | np.isnan(zt_arr))
+
+    for i in numba.prange(nrow):
+        for j in range(ncol):
+            tops = src_top[i, j]
+            bots = src_bot[i, j]
+            monotonic = _is_descending(tops, bots)
+
+            for ii in range(nz):
+                dst[ii, i, j] = np.nan
+                if not valid[ii]:
+                    continue
+
+                zb = zb_arr[ii]
+                zt = zt_arr[ii]
+                if monotonic:
+                    jj_lo, jj_hi = _layer_bounds(tops, bots, zb, zt)
+                else:
+                    jj_lo, jj_hi = 0, nlayer
+                vsum = 0.0
+                wsum = 0.0
+                has_value = False
+                for jj in range(jj_lo, jj_hi):
+                    overlap = max(0.0, min(tops[jj], zt) - max(bots[jj], zb))
+                    if overlap == 0:
+                        continue
+
+                    has_value = True
+                    v = src[i, j, jj]
+                    if np.isnan(v):
+                        continue
+                    vsum += overlap * v
+                    wsum += overlap
+
+                if has_value:
+                    if wsum == 0:
+                        dst[ii, i, j] = np.nan
+                    else:
+                        dst[ii, i, j] = vsum / wsum
+
+    return dst
+
+
+@functools.lru_cache(maxsize=None)
+def _build_voxelize(method):
+    """
+    Use closure to avoid numba overhead; compile once per unique method
+    per process, so repeated Voxelizer instantiation reuses the kernel.
+    """
+    if method is common.mean:
+        return _voxelize_weighted_mean
+
+    jit_method = numba.njit(method)
+
+    @numba.njit(_VOXELIZE_SIGNATURE)
+    def voxelize(src, dst, src_top, src_bot, dst_z):
+        return _voxelize(src, dst, src_top, src_bot, dst_z, jit_method)
+
+    return voxelize
+
+
 class Voxelizer:
     """
-    Object to repeatedly voxelize similar objects. Compiles once on first call,
-    can then be repeatedly called without JIT compilation overhead.
+    Object to repeatedly voxelize similar objects. Compiles once on
+    construction, can then be repeatedly called without JIT compilation
+    overhead.
 
     Attributes
     ----------
@@ -106,19 +223,7 @@ class Voxelizer:
     def __init__(self, method, use_relative_weights=False):
         _method = common._get_method(method, METHODS)
         self.method = _method
-        self._first_call = True
-
-    def _make_voxelize(self):
-        """
-        Use closure to avoid numba overhead
-        """
-        jit_method = numba.njit(self.method)
-
-        @numba.njit
-        def voxelize(src, dst, src_top, src_bot, dst_z):
-            return _voxelize(src, dst, src_top, src_bot, dst_z, jit_method)
-
-        self._voxelize = voxelize
+        self._voxelize = _build_voxelize(_method)
 
     def voxelize(self, source, top, bottom, like):
         """
@@ -165,18 +270,17 @@ class Voxelizer:
                     "Dimensions for top, bottom, and source have to be exactly"
                     f' ("layer", "y", "x"). Got instead {dim_format(da.dims)}.'
                 )
-        for da in [bottom, source]:
-            for dim in ["layer", "y", "x"]:
-                if not top[dim].equals(da[dim]):
-                    raise ValueError(f"Input coordinates do not match along {dim}")
-
-        if self._first_call:
-            self._make_voxelize()
-            self._first_call = False
-
+        try:
+            # Short-circuits on identical indexes, rather than comparing
+            # every coordinate element by element.
+            xr.align(top, bottom, source, join="exact")
+        except ValueError as e:
+            raise ValueError(f"Input coordinates do not match: {e}") from e
+
+        # _coord always computes ascending edges, flipping descending
+        # coordinates internally; no need to reverse like["z"] first.
         like_z = like["z"]
         if not like_z.indexes["z"].is_monotonic_increasing:
-            like_z = like_z.isel(z=slice(None, None, -1))
             dst_z = common._coord(like_z, "z")[::-1]
         else:
             dst_z = common._coord(like_z, "z")
@@ -192,9 +296,19 @@ class Voxelizer:
         dst_dims = ("z", "y", "x")
         dst_shape = (dst_nlayer, nrow, ncol)
 
-        dst = xr.DataArray(np.full(dst_shape, np.nan), dst_coords, dst_dims)
-        dst.values = self._voxelize(
-            source.values, dst.values, top.values, bottom.values, dst_z
+        # Transpose the inputs to layer-fastest order so the kernels read
+        # each column as unit-stride memory. Cast to float64 to match the
+        # explicit kernel signature: float32 (the IDF default) and integer
+        # sources are accepted, and the output has always been float64.
+        src = np.ascontiguousarray(np.moveaxis(source.values, 0, -1), dtype=np.float64)
+        src_top = np.ascontiguousarray(np.moveaxis(top.values, 0, -1), dtype=np.float64)
+        src_bot = np.ascontiguousarray(
+            np.moveaxis(bottom.values, 0, -1), dtype=np.float64
         )
 
+        # The kernels write every destination element, NaN included, so
+        # the array does not have to be pre-filled.
+        dst = xr.DataArray(np.empty(dst_shape), dst_coords, dst_dims)
+        dst.values = self._voxelize(src, dst.values, src_top, src_bot, dst_z)
+
         return dst
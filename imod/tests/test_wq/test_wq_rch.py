@@ -9,53 +9,48 @@ import xarray as xr
 from imod.wq import RechargeHighestActive, RechargeLayers, RechargeTopLayer
 
 
-@pytest.fixture(scope="function")
-def recharge_top():
+@pytest.fixture(scope="module")
+def base_rate():
+    """
+    Shared read-only rate array: the packages do not copy or mutate their
+    inputs, so the fixtures below can all alias this single buffer.
+    """
     datetimes = pd.date_range("2000-01-01", "2000-01-05")
     y = np.arange(4.5, 0.0, -1.0)
     x = np.arange(0.5, 5.0, 1.0)
-    rate = xr.DataArray(
-        np.full((5, 5, 5), 1.0),
+    values = np.full((5, 5, 5), 1.0)
+    values.setflags(write=False)
+    return xr.DataArray(
+        values,
         coords={"time": datetimes, "y": y, "x": x, "dx": 1.0, "dy": -1.0},
         dims=("time", "y", "x"),
     )
 
-    rch = RechargeTopLayer(rate=rate, concentration=rate.copy(), save_budget=False)
+
+@pytest.fixture(scope="function")
+def recharge_top(base_rate):
+    rch = RechargeTopLayer(rate=base_rate, concentration=base_rate, save_budget=False)
     return rch
 
 
 @pytest.fixture(scope="function")
-def recharge_layers():
-    datetimes = pd.date_range("2000-01-01", "2000-01-05")
-    y = np.arange(4.5, 0.0, -1.0)
-    x = np.arange(0.5, 5.0, 1.0)
-    rate = xr.DataArray(
-        np.full((5, 5, 5), 1.0),
-        coords={"time": datetimes, "y": y, "x": x, "dx": 1.0, "dy": -1.0},
-        dims=("time", "y", "x"),
-    )
-
+def recharge_layers(base_rate):
     rch = RechargeLayers(
-        rate=rate,
-        recharge_layer=rate.copy(),
-        concentration=rate.copy(),
+        rate=base_rate,
+        recharge_layer=base_rate,
+        concentration=base_rate,
         save_budget=False,
     )
     return rch
 
 
 @pytest.fixture(scope="function")
-def recharge_ha():
-    datetimes = pd.date_range("2000-01-01", "2000-01-05")
-    y = np.arange(4.5, 0.0, -1.0)
-    x = np.arange(0.5, 5.0, 1.0)
-    rate = xr.DataArray(
-        np.full((5, 5, 5), 1.0),
-        coords={"time": datetimes, "y": y, "x": x, "dx": 1.0, "dy": -1.0},
-        dims=("time", "y", "x"),
+def recharge_ha(base_rate):
+    # test_ssm_cellcount_scalar_highest_active writes NaNs into the rate,
+    # so this fixture cannot alias the shared read-only buffer for it.
+    rch = RechargeHighestActive(
+        rate=base_rate.copy(), concentration=base_rate, save_budget=False
     )
-
-    rch = RechargeHighestActive(rate=rate, concentration=rate.copy(), save_budget=False)
     return rch
 
 
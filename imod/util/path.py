@@ -5,6 +5,7 @@ automatically in :func:`imod.idf`.
 """
 
 import datetime
+import functools
 import pathlib
 import re
 import tempfile
@@ -17,7 +18,13 @@ from imod.util.time import _compose_timestring, to_datetime
 
 Pattern = re.Pattern
 
+# Compiled once: these run for every file in a dataset load.
+_LAYER_PATTERN = re.compile(r"_l\d+$")
+# We are strict in recognizing species
+_SPECIES_PATTERN = re.compile(r"conc_c\d{1,3}_\d{8,14}")
 
+
+@functools.lru_cache(maxsize=128)
 def _custom_pattern_to_regex_pattern(pattern: str):
     """
     Compile iMOD Python's simplified custom pattern to regex pattern:
@@ -46,6 +53,22 @@ def _groupdict_from_pattern(stem: str, pattern: Pattern) -> Dict:
         return match.groupdict()
 
 
+@functools.lru_cache(maxsize=None)
+def _default_pattern(has_species: bool, has_time: bool, has_layer: bool) -> Pattern:
+    """
+    Compile one of the eight "iMOD conventions" patterns:
+    {name}_c{species}_{time}_l{layer} with optional parts.
+    """
+    base_pattern = r"(?P<name>[\w-]+)"
+    if has_species:
+        base_pattern += r"_c(?P<species>[0-9]+)"
+    if has_time:
+        base_pattern += r"_(?P<time>[0-9-]{6,})"
+    if has_layer:
+        base_pattern += r"_l(?P<layer>[0-9]+)"
+    return re.compile(base_pattern)
+
+
 def _groupdict(stem: str, pattern: Optional[str | Pattern]) -> Dict:
     if pattern is not None:
         if isinstance(pattern, Pattern):
@@ -55,25 +78,12 @@ def _groupdict(stem: str, pattern: Optional[str | Pattern]) -> Dict:
             # Use it to get the required variables
             d = _groupdict_from_pattern(stem, re_pattern)
     else:  # Default to "iMOD conventions": {name}_c{species}_{time}_l{layer}
-        has_layer = bool(re.search(r"_l\d+$", stem))
-        has_species = bool(
-            re.search(r"conc_c\d{1,3}_\d{8,14}", stem)
-        )  # We are strict in recognizing species
-        base_pattern = r"(?P<name>[\w-]+)"
-        if has_species:
-            base_pattern += r"_c(?P<species>[0-9]+)"
-        base_pattern += r"_(?P<time>[0-9-]{6,})"
-        if has_layer:
-            base_pattern += r"_l(?P<layer>[0-9]+)"
-        re_pattern = re.compile(base_pattern)
+        has_layer = bool(_LAYER_PATTERN.search(stem))
+        has_species = bool(_SPECIES_PATTERN.search(stem))
+        re_pattern = _default_pattern(has_species, True, has_layer)
         d = _groupdict_from_pattern(stem, re_pattern)
         if not d:  # If no match, try without time
-            base_pattern = r"(?P<name>[\w-]+)"
-            if has_species:
-                base_pattern += r"_c(?P<species>[0-9]+)"
-            if has_layer:
-                base_pattern += r"_l(?P<layer>[0-9]+)"
-            re_pattern = re.compile(base_pattern)
+            re_pattern = _default_pattern(has_species, False, has_layer)
             d = _groupdict_from_pattern(stem, re_pattern)
     return d
 
@@ -10,6 +10,7 @@ import re
 from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence, Tuple, Union
 
 import affine
+import numba
 import numpy as np
 import pandas as pd
 import xarray as xr
@@ -161,6 +162,15 @@ def spatial_reference(
     return dx, xmin, xmax, dy, ymin, ymax
 
 
+@numba.njit(cache=True)
+def _is_constant(a) -> bool:
+    first = a[0]
+    for i in range(1, a.size):
+        if a[i] != first:
+            return False
+    return True
+
+
 def transform(a: xr.DataArray) -> affine.Affine:
     """
     Extract the spatial reference information from the DataArray coordinates,
@@ -179,7 +189,13 @@ def transform(a: xr.DataArray) -> affine.Affine:
 
     def equidistant(dx, name):
         if isinstance(dx, np.ndarray):
-            if np.unique(dx).size == 1:
+            # No np.unique here: that sorts, whereas this scan exits on
+            # the first differing cellsize. Small arrays skip the JIT.
+            if dx.size < 64:
+                constant = bool((dx == dx[0]).all())
+            else:
+                constant = _is_constant(dx)
+            if constant:
                 return dx[0]
             else:
                 raise ValueError(f"DataArray is not equidistant along {name}")
@@ -705,9 +721,12 @@ def is_divisor(numerator: Union[float, FloatArray], denominator: float) -> bool:
     -------
     is_divisor: bool
     """
-    denominator = np.abs(denominator)
-    remainder = np.abs(numerator) % denominator
-    return bool(np.all(np.isclose(remainder, 0.0) | np.isclose(remainder, denominator)))
+    # Check how far the ratio is from a whole number rather than taking
+    # a modulo and comparing it against both 0 and the denominator: one
+    # fused pass instead of two isclose passes. The tolerance is
+    # relative to the denominator, like the old isclose band.
+    ratio = np.abs(numerator) / abs(denominator)
+    return bool(np.all(np.abs(ratio - np.round(ratio)) < 1.0e-5))
 
 
 def _polygonize(da: xr.DataArray) -> "gpd.GeoDataFrame":
@@ -1,9 +1,83 @@
 from typing import Any, Optional
 
+import numba
 import numpy as np
 import xarray as xr
 
 
+@numba.njit(cache=True, parallel=True)
+def _fused_where(cond, t, f, out, keep_nan):
+    for i in numba.prange(out.size):
+        v = t[i]
+        if (keep_nan and np.isnan(v)) or cond[i]:
+            out[i] = v
+        else:
+            out[i] = f[i]
+
+
+@numba.njit(cache=True, parallel=True)
+def _fused_where_scalar(cond, t, f, out, keep_nan):
+    for i in numba.prange(out.size):
+        v = t[i]
+        if (keep_nan and np.isnan(v)) or cond[i]:
+            out[i] = v
+        else:
+            out[i] = f
+
+
+def _where_dense(condition, if_true, if_false, keep_nan):
+    """
+    Fused single-pass path for dense numpy-backed float DataArrays with
+    matching dimensions. Returns None when the inputs do not qualify,
+    in which case the generic xarray path must be taken.
+    """
+    if not (isinstance(condition, xr.DataArray) and isinstance(if_true, xr.DataArray)):
+        return None
+    if not (
+        isinstance(condition.data, np.ndarray)
+        and isinstance(if_true.data, np.ndarray)
+        and condition.dims == if_true.dims
+        and condition.shape == if_true.shape
+        and condition.dtype == bool
+        and np.issubdtype(if_true.dtype, np.floating)
+    ):
+        return None
+
+    da_false = isinstance(if_false, xr.DataArray)
+    if da_false:
+        if not (
+            isinstance(if_false.data, np.ndarray)
+            and if_false.dims == if_true.dims
+            and if_false.shape == if_true.shape
+            and np.issubdtype(if_false.dtype, np.floating)
+        ):
+            return None
+    elif isinstance(if_false, bool) or not isinstance(
+        if_false, (int, float, np.integer, np.floating)
+    ):
+        return None
+
+    try:
+        # The kernels index positionally: coordinates have to match
+        # exactly, or xarray's aligning behavior would be lost.
+        if da_false:
+            xr.align(condition, if_true, if_false, join="exact")
+        else:
+            xr.align(condition, if_true, join="exact")
+    except ValueError:
+        return None
+
+    cond = condition.data.ravel()
+    t = if_true.data.ravel()
+    if da_false:
+        out = np.empty(t.size, dtype=np.result_type(t, if_false.data))
+        _fused_where(cond, t, if_false.data.ravel(), out, keep_nan)
+    else:
+        out = np.empty(t.size, dtype=np.result_type(t, if_false))
+        _fused_where_scalar(cond, t, float(if_false), out, keep_nan)
+    return if_true.copy(data=out.reshape(if_true.shape))
+
+
 def where(condition, if_true, if_false, keep_nan: bool = True) -> xr.DataArray:
     """
     Wrapped version of xarray's ``.where``.
@@ -30,6 +104,10 @@ def where(condition, if_true, if_false, keep_nan: bool = True) -> xr.DataArray:
     keep_nan: bool, default: True
         Whether to keep the NaN values in place of ``if_true``.
     """
+    fused = _where_dense(condition, if_true, if_false, keep_nan)
+    if fused is not None:
+        return fused
+
     xr_obj = (xr.DataArray, xr.Dataset)
     da_true = isinstance(if_true, xr_obj)
     da_false = isinstance(if_false, xr_obj)
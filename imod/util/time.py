@@ -110,7 +110,11 @@ def timestep_duration(times: np.ndarray, use_cftime: bool):
         stress period duration in decimal days
     """
     if not use_cftime:
-        times = pd.to_datetime(times)
+        # Vectorized path: whole seconds (like timedelta.days and
+        # timedelta.seconds below) in a single C-level pass.
+        times = pd.DatetimeIndex(pd.to_datetime(times)).values
+        seconds = np.diff(times).astype("timedelta64[s]").astype(np.float64)
+        return seconds / 86400.0
 
     timestep_duration = []
     for start, end in zip(times[:-1], times[1:]):
@@ -172,12 +176,12 @@ def _convert_datetimes(times: np.ndarray, use_cftime: bool):
             cftime.DatetimeProlepticGregorian(*time.timetuple()[:6]) for time in times
         ]
     else:
-        for time in times:
-            try:
-                _check_year(time.year)
-            except ValueError:
-                out_of_bounds = True
-                break
+        # Same bounds as _check_year, but checked in one array compare
+        # instead of a Python-level try/except per element.
+        years = np.fromiter(
+            (time.year for time in times), dtype=np.int64, count=len(times)
+        )
+        out_of_bounds = bool((years < 1678).any() or (years > 2261).any())
 
         if out_of_bounds:
             use_cftime = True
@@ -188,7 +192,7 @@ def _convert_datetimes(times: np.ndarray, use_cftime: bool):
                 for time in times
             ]
         else:
-            converted = [np.datetime64(time, "ns") for time in times]
+            converted = np.array(times, dtype="datetime64[ns]")
 
     return converted, use_cftime
 
@@ -204,9 +208,20 @@ def _compose_timestring(
         return str(time)  # the conversion to str is for mypy
     else:
         if isinstance(time, np.datetime64):
+            if time_format == "%Y%m%d%H%M%S":
+                # Reorder numpy's ISO string directly: no intermediate
+                # datetime.datetime object is created per call.
+                s = np.datetime_as_string(time, unit="s")
+                return s[:4] + s[5:7] + s[8:10] + s[11:13] + s[14:16] + s[17:19]
             # The following line is because numpy.datetime64[ns] does not
             # support converting to datetime, but returns an integer instead.
             # This solution is 20 times faster than using pd.to_datetime()
-            return time.astype("datetime64[us]").item().strftime(time_format)
-        else:
-            return time.strftime(time_format)
+            time = time.astype("datetime64[us]").item()
+        if time_format == "%Y%m%d%H%M%S":
+            # Format the default stamp with an f-string: strftime pays a
+            # locale lookup per field, and this runs once per file saved.
+            return (
+                f"{time.year:04d}{time.month:02d}{time.day:02d}"
+                f"{time.hour:02d}{time.minute:02d}{time.second:02d}"
+            )
+        return time.strftime(time_format)
@@ -76,10 +76,8 @@ class BasicTransport(Package):
         "    sconc_t{{species}}_l{{layer}} = {{value}}\n"
         "        {%- endfor -%}\n"
         "    {%- endfor -%}\n"
-        "    {%- for name, dictname in mapping -%}\n"
-        "        {%- for layer, value in dicts[dictname].items() %}\n"
+        "    {%- for name, layer, value in entries %}\n"
         "    {{name}}_l{{layer}} = {{value}}\n"
-        "        {%- endfor -%}\n"
         "    {%- endfor -%}\n"
     )
 
@@ -116,8 +114,6 @@ class BasicTransport(Package):
         rendered : str
         """
         d = {}
-        dicts = {}
-        d["mapping"] = self._mapping
         # Starting concentration also includes a species, and can't be written
         # in the same way as the other variables; _T? in the runfile
         if "species" in self.dataset["starting_concentration"].coords:
@@ -139,24 +135,27 @@ class BasicTransport(Package):
                 )
             }
 
-        # Collect which entries are complex (multi-dim)
-        data_vars = [t[1] for t in self._mapping]
+        # Simple entries: just get the scalar value
+        mapped_vars = {varname for _, varname in self._mapping}
         for varname in self.dataset.data_vars.keys():
             if varname == "starting_concentration":
                 continue  # skip it, as mentioned above
-            if varname in data_vars:  # multi-dim entry
-                dicts[varname] = self._compose_values_layer(
-                    varname, directory, nlayer=nlayer
-                )
-            else:  # simple entry, just get the scalar value
+            if varname not in mapped_vars:
                 d[varname] = self.dataset[varname].values
 
-        # Add these from the outside, thickness from BasicFlow
-        # layer_type from LayerPropertyFlow
-        dicts["thickness"] = self._compose_values_layer(
-            "thickness", directory, nlayer=nlayer, da=self.dataset.thickness
-        )
-        d["dicts"] = dicts
+        # Compose the mapped (multi-dim) entries straight into a flat
+        # list of (name, layer, value) tuples, so the template runs a
+        # single loop without per-value dict lookups. Thickness is added
+        # from the outside: taken from BasicFlow by the model.
+        entries = []
+        for name, varname in self._mapping:
+            da = self.dataset.thickness if varname == "thickness" else None
+            composed = self._compose_values_layer(
+                varname, directory, nlayer=nlayer, da=da
+            )
+            for layer, value in composed.items():
+                entries.append((name, layer, value))
+        d["entries"] = entries
         return self._template.render(d)
 
     def _pkgcheck(self, ibound=None):
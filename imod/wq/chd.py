@@ -21,15 +21,20 @@ class ConstantHead(BoundaryCondition):
         Default is False.
     """
 
+    __slots__ = ()
+
     _pkg_id = "chd"
     _mapping = (("shead", "head_start"), ("ehead", "head_end"))
 
     def __init__(self, head_start, head_end, concentration, save_budget=False):
-        super().__init__()
-        self["head_start"] = head_start
-        self["head_end"] = head_end
-        self["concentration"] = concentration
-        self["save_budget"] = save_budget
+        super().__init__(
+            {
+                "head_start": head_start,
+                "head_end": head_end,
+                "concentration": concentration,
+                "save_budget": save_budget,
+            }
+        )
 
     def _pkgcheck(self, ibound=None):
         self._check_positive(["concentration"])
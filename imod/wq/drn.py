@@ -19,6 +19,8 @@ class Drainage(BoundaryCondition):
         Default is False.
     """
 
+    __slots__ = ()
+
     _pkg_id = "drn"
 
     _mapping = (("elevation", "elevation"), ("cond", "conductance"))
@@ -7,6 +7,8 @@ from imod.wq.pkgbase import BoundaryCondition
 
 
 class Evapotranspiration(BoundaryCondition, abc.ABC):
+    __slots__ = ()
+
     _pkg_id = "evt"
 
     _mapping = (
@@ -60,6 +62,8 @@ class Evapotranspiration(BoundaryCondition, abc.ABC):
 
 
 class EvapotranspirationTopLayer(Evapotranspiration):
+    __slots__ = ()
+
     _option = 1
 
     def __init__(
@@ -82,6 +86,8 @@ class EvapotranspirationTopLayer(Evapotranspiration):
 
 
 class EvapotranspirationLayers(Evapotranspiration):
+    __slots__ = ()
+
     _option = 2
 
     _mapping = (
@@ -115,6 +121,8 @@ class EvapotranspirationLayers(Evapotranspiration):
 
 
 class EvapotranspirationHighestActive(Evapotranspiration):
+    __slots__ = ()
+
     _option = 3
 
     def __init__(
@@ -33,19 +33,23 @@ class GeneralHeadBoundary(BoundaryCondition):
         Default is False.
     """
 
+    __slots__ = ()
+
     _pkg_id = "ghb"
     _mapping = (("bhead", "head"), ("cond", "conductance"), ("ghbssmdens", "density"))
 
     def __init__(
         self, head, conductance, density, concentration=None, save_budget=False
     ):
-        super().__init__()
-        self["head"] = head
-        self["conductance"] = conductance
-        self["density"] = density
-        if concentration is not None:
-            self["concentration"] = concentration
-        self["save_budget"] = save_budget
+        super().__init__(
+            {
+                "head": head,
+                "conductance": conductance,
+                "density": density,
+                "concentration": concentration,
+                "save_budget": save_budget,
+            }
+        )
 
     def _pkgcheck(self, ibound=None):
         to_check = ["conductance", "density"]
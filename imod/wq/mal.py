@@ -11,6 +11,8 @@ class MassLoading(BoundaryCondition):
     concentration: xr.DataArray of floats
     """
 
+    __slots__ = ()
+
     _pkg_id = "mal"
 
     def __init__(self, concentration):
@@ -1,7 +1,8 @@
-import abc
+import os
 import pathlib
 import warnings
 
+import dask
 import jinja2
 import numpy as np
 import xarray as xr
@@ -10,7 +11,7 @@ import imod
 from imod.util.time import forcing_starts_ends, to_datetime_internal
 
 
-class Package(abc.ABC):
+class Package:
     """
     Base package for the different SEAWAT packages.
     Every package contains a ``_pkg_id`` for identification.
@@ -25,6 +26,10 @@ class Package(abc.ABC):
     keyword argument by integer arguments for SEAWAT.
     """
 
+    # All instance state lives in these attributes; declaring them avoids
+    # a per-instance __dict__ for subclasses that also define __slots__.
+    __slots__ = ("dataset", "_cellcount", "_ssm_cellcount", "_ssm_layers")
+
     @classmethod
     def from_file(cls, path, **kwargs):
         """
@@ -78,10 +83,22 @@ class Package(abc.ABC):
 
         return return_cls
 
-    def __init__(self):
-        self.dataset = xr.Dataset()
+    def __init__(self, data_vars=None):
+        # Constructing the Dataset from a dict aligns all variables in a
+        # single pass, rather than once per __setitem__ call.
+        if data_vars is None:
+            self.dataset = xr.Dataset()
+        else:
+            self.dataset = xr.Dataset(
+                {
+                    key: self._enforce_layer_dim(value)
+                    for key, value in data_vars.items()
+                    if value is not None
+                }
+            )
 
-    def __setitem__(self, key, value):
+    @staticmethod
+    def _enforce_layer_dim(value):
         if isinstance(value, xr.DataArray):
             if "z" in value.dims:
                 if "layer" not in value.coords:
@@ -91,7 +108,10 @@ class Package(abc.ABC):
                 value = value.swap_dims({"z": "layer"})
             if "layer" in value.dims:
                 value = value.dropna(dim="layer", how="all")
-        self.dataset.__setitem__(key, value)
+        return value
+
+    def __setitem__(self, key, value):
+        self.dataset.__setitem__(key, self._enforce_layer_dim(value))
 
     def __getitem__(self, key):
         return self.dataset.__getitem__(key)
@@ -207,12 +227,17 @@ class Package(abc.ABC):
             Alternatively: {layer number: scalar value}. The layer number may be
             a wildcard (e.g. '?').
         """
-        pattern = "{name}"
-
-        values = {}
         if da is None:
             da = self.dataset[varname]
+        d, pattern = self._compose_prefix(da, varname, directory, time)
+        compose = self._select_compose_method(da)
+        return compose(da, d, pattern, nlayer, compress)
 
+    def _compose_prefix(self, da, varname, directory, time):
+        """
+        Build the shared compose dict and filename pattern prefix.
+        """
+        pattern = "{name}"
         d = {"directory": directory, "name": varname, "extension": ".idf"}
 
         if "species" in da.coords:
@@ -223,63 +248,91 @@ class Package(abc.ABC):
             d["time"] = time
             pattern += "_{time:%Y%m%d%H%M%S}"
 
-        # Scalar value or not?
-        # If it's a scalar value we can immediately write
-        # otherwise, we have to write a file path
-        if "y" not in da.coords and "x" not in da.coords:
-            idf = False
+        return d, pattern
+
+    def _select_compose_method(self, da):
+        """
+        Determine the (scalar versus IDF) x (layered versus unlayered) case
+        once, so callers in time loops can bind the specialized method
+        instead of re-branching per stress period.
+
+        If it's a scalar value we can immediately write, otherwise we have
+        to write a file path.
+        """
+        idf = "y" in da.coords or "x" in da.coords
+        if "layer" in da.coords:
+            return self._compose_idf_layered if idf else self._compose_scalar_layered
+        return self._compose_idf_unlayered if idf else self._compose_scalar_unlayered
+
+    def _compose_idf_unlayered(self, da, d, pattern, nlayer, compress):
+        # Special case concentration
+        # Using "?" results in too many sinks and sources according to imod-wq.
+        values = {}
+        pattern += "{extension}"
+        if hasattr(self, "_ssm_layers"):
+            # The pattern contains no layer token: the path is
+            # identical for every layer, so compose only once.
+            path = self._compose_path(d, pattern=pattern)
+            for layer in self._ssm_layers:
+                values[layer] = path
         else:
-            idf = True
-
-        if "layer" not in da.coords:
-            if idf:
-                # Special case concentration
-                # Using "?" results in too many sinks and sources according to imod-wq.
-                pattern += "{extension}"
-                if hasattr(self, "_ssm_layers"):
-                    for layer in self._ssm_layers:
-                        d["layer"] = layer
-                        values[layer] = self._compose_path(d, pattern=pattern)
-                else:
-                    values["?"] = self._compose_path(d, pattern=pattern)
-            else:
-                # Special case concentration
-                # Using "?" results in too many sinks and sources according to imod-wq.
-                if hasattr(self, "_ssm_layers"):
-                    for layer in self._ssm_layers:
-                        values[layer] = da.values[()]
-                    values = self._compress_values(values)
-                else:
-                    values["?"] = da.values[()]
+            values["?"] = self._compose_path(d, pattern=pattern)
+        return values
 
+    def _compose_scalar_unlayered(self, da, d, pattern, nlayer, compress):
+        # Special case concentration
+        # Using "?" results in too many sinks and sources according to imod-wq.
+        values = {}
+        if hasattr(self, "_ssm_layers"):
+            value = da.values[()]
+            for layer in self._ssm_layers:
+                values[layer] = value
+            values = self._compress_values(values)
         else:
-            pattern += "_l{layer}{extension}"
-            for layer in np.atleast_1d(da.coords["layer"].values):
-                if idf:
-                    d["layer"] = layer
-                    values[layer] = self._compose_path(d, pattern=pattern)
-                else:
-                    if "layer" in da.dims:
-                        values[layer] = da.sel(layer=layer).values[()]
-                    else:
-                        values[layer] = da.values[()]
+            values["?"] = da.values[()]
+        return values
+
+    def _compose_idf_layered(self, da, d, pattern, nlayer, compress):
+        # The composed path only varies in the layer number: compose once
+        # (including the relatively expensive time formatting) and
+        # substitute the layer token per iteration. Compose does not accept
+        # non-integers, so use 0, then replace.
+        pattern += "_l{layer}{extension}"
+        d["layer"] = 0
+        token_path = self._compose_path(d, pattern=pattern)
+        layers = np.atleast_1d(da.coords["layer"].values)
+        values = {
+            layer: token_path.replace("_l0", f"_l{layer}") for layer in layers
+        }
 
         # Compress the runfile contents using the imod-wq macros
         if "layer" in da.dims:
-            if idf and da["layer"].size == nlayer:
-                # Compose does not accept non-integers, so use 0, then replace
-                d["layer"] = 0
-                token_path = imod.util.path.compose(d, pattern=pattern).as_posix()
-                token_path = token_path.replace("_l0", "_l$")
-                values = {"$": token_path}
-            elif idf and compress:
-                # Compose does not accept non-integers, so use 0, then replace
-                d["layer"] = 0
-                range_path = imod.util.path.compose(d, pattern=pattern).as_posix()
-                range_path = range_path.replace("_l0", "_l:")
-                values = self._compress_idflayers(values, range_path)
+            if layers.size == nlayer:
+                values = {"$": token_path.replace("_l0", "_l$")}
             elif compress:
-                values = self._compress_values(values)
+                range_path = token_path.replace("_l0", "_l:")
+                values = self._compress_idflayers(values, range_path)
+
+        return values
+
+    def _compose_scalar_layered(self, da, d, pattern, nlayer, compress):
+        values = {}
+        layers = np.atleast_1d(da.coords["layer"].values)
+        if "layer" not in da.dims:
+            value = da.values[()]
+            for layer in layers:
+                values[layer] = value
+        elif da.ndim == 1:
+            # Avoid an xarray sel call per layer.
+            for layer, value in zip(layers, da.values):
+                values[layer] = value
+        else:
+            for layer in layers:
+                values[layer] = da.sel(layer=layer).values[()]
+
+        # Compress the runfile contents using the imod-wq macros
+        if "layer" in da.dims and compress:
+            values = self._compress_values(values)
 
         return values
 
@@ -322,10 +375,17 @@ class Package(abc.ABC):
             package_times = da.coords["time"].values
 
             starts_ends = forcing_starts_ends(package_times, globaltimes)
-            for itime, start_end in enumerate(starts_ends):
-                # TODO: this now fails on a non-dim time too
-                # solution roughly the same as for layer above?
-                values[start_end] = da.isel(time=itime).values[()]
+            if da.dims == ("time",):
+                # Realize all time steps in one pass; for dask-backed data
+                # this collapses one compute per time step into one total.
+                arr = da.values
+                for itime, start_end in enumerate(starts_ends):
+                    values[start_end] = arr[itime]
+            else:
+                for itime, start_end in enumerate(starts_ends):
+                    # TODO: this now fails on a non-dim time too
+                    # solution roughly the same as for layer above?
+                    values[start_end] = da.isel(time=itime).values[()]
         else:
             values["?"] = da.values[()]
 
@@ -333,9 +393,21 @@ class Package(abc.ABC):
         return values
 
     def save(self, directory):
-        for name, da in self.dataset.data_vars.items():  # pylint: disable=no-member
-            if "y" in da.coords and "x" in da.coords:
-                path = pathlib.Path(directory).joinpath(name)
+        # Join paths as strings: idf.save accepts those, and this skips a
+        # pathlib.Path construction per data variable.
+        base = os.fspath(directory)
+        to_save = [
+            (os.path.join(base, name), da)
+            for name, da in self.dataset.data_vars.items()  # pylint: disable=no-member
+            if "y" in da.coords and "x" in da.coords
+        ]
+        if len(to_save) > 1:
+            # Writing IDFs is I/O bound and the binary writes release the
+            # GIL: write the variables concurrently.
+            tasks = [dask.delayed(imod.idf.save)(path, da) for path, da in to_save]
+            dask.compute(tasks, scheduler="threads")
+        else:
+            for path, da in to_save:
                 imod.idf.save(path, da)
 
     def _check_positive(self, varnames):
@@ -387,7 +459,7 @@ class Package(abc.ABC):
                     )
 
 
-class BoundaryCondition(Package, abc.ABC):
+class BoundaryCondition(Package):
     """
     Base package for (transient) boundary conditions:
     * recharge
@@ -397,6 +469,8 @@ class BoundaryCondition(Package, abc.ABC):
     * drainage
     """
 
+    __slots__ = ()
+
     _template = jinja2.Template(
         "    {%- for name, dictname in mapping -%}"
         "        {%- for time, timedict in dicts[dictname].items() -%}"
@@ -483,34 +557,62 @@ class BoundaryCondition(Package, abc.ABC):
             da = self.dataset[varname]
 
         if "time" in da.coords:
+            if da.chunks is not None and "y" not in da.coords and "x" not in da.coords:
+                # Scalar (non-IDF) data is read per (time, layer) in
+                # _compose_values_layer: load once up front so dask does not
+                # compute once per read.
+                da = da.load()
             da_times = da.coords["time"].values
             if "stress_repeats" in da.attrs:
                 stress_repeats_keys = np.array(list(da.attrs["stress_repeats"].keys()))
                 stress_repeats_values = np.array(
                     list(da.attrs["stress_repeats"].values())
                 )
-                package_times, inds = np.unique(
-                    np.concatenate([da_times, stress_repeats_keys]), return_index=True
-                )
-                # Times to write in the runfile
-                runfile_times = np.concatenate([da_times, stress_repeats_values])[inds]
+                if np.all(da_times[1:] > da_times[:-1]) and np.all(
+                    stress_repeats_keys[1:] > stress_repeats_keys[:-1]
+                ):
+                    # Both already sorted (the common case): merge linearly
+                    # instead of sorting the concatenated arrays. Keys that
+                    # coincide with a package time are dropped, as the
+                    # package's own time wins there.
+                    insert_index = np.searchsorted(da_times, stress_repeats_keys)
+                    inside = insert_index < da_times.size
+                    present = np.zeros(stress_repeats_keys.size, dtype=bool)
+                    present[inside] = (
+                        da_times[insert_index[inside]] == stress_repeats_keys[inside]
+                    )
+                    new = ~present
+                    insert_index = insert_index[new]
+                    package_times = np.insert(
+                        da_times, insert_index, stress_repeats_keys[new]
+                    )
+                    # Times to write in the runfile
+                    runfile_times = np.insert(
+                        da_times, insert_index, stress_repeats_values[new]
+                    )
+                else:
+                    package_times, inds = np.unique(
+                        np.concatenate([da_times, stress_repeats_keys]),
+                        return_index=True,
+                    )
+                    # Times to write in the runfile
+                    runfile_times = np.concatenate(
+                        [da_times, stress_repeats_values]
+                    )[inds]
             else:
                 runfile_times = package_times = da_times
 
             starts_ends = forcing_starts_ends(package_times, globaltimes)
 
+            # The scalar-versus-IDF and layered-versus-unlayered case is
+            # invariant over time: bind the specialized method once.
+            compose = self._select_compose_method(da)
             for time, start_end in zip(runfile_times, starts_ends):
                 # Check whether any range occurs in the input.
                 # If does does, compress should be False
                 compress = ":" not in start_end
-                values[start_end] = self._compose_values_layer(
-                    varname,
-                    directory,
-                    nlayer=nlayer,
-                    time=time,
-                    da=da,
-                    compress=compress,
-                )
+                d, pattern = self._compose_prefix(da, varname, directory, time)
+                values[start_end] = compose(da, d, pattern, nlayer, compress)
 
         else:
             values["?"] = self._compose_values_layer(
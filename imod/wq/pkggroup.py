@@ -1,9 +1,8 @@
 import abc
-import collections
 import enum
 
 
-class PackageGroup(collections.UserDict, abc.ABC):
+class PackageGroup(dict, abc.ABC):
     """
     Groups for packes that support multiple systems:
     * chd
@@ -11,10 +10,14 @@ class PackageGroup(collections.UserDict, abc.ABC):
     * ghb
     * riv
     * wel
+
+    Subclasses dict directly rather than collections.UserDict: the groups
+    are plain containers, and UserDict routes every item access through
+    Python-level delegation.
     """
 
     def __init__(self, **kwargs):
-        collections.UserDict.__init__(self)
+        super().__init__()
         for k, v in kwargs.items():
             self[k] = v
         self.reorder_keys()
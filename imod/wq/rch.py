@@ -7,6 +7,8 @@ from imod.wq.pkgbase import BoundaryCondition
 
 
 class Recharge(BoundaryCondition, abc.ABC):
+    __slots__ = ()
+
     _pkg_id = "rch"
 
     _mapping = (("rech", "rate"),)
@@ -72,6 +74,8 @@ class RechargeTopLayer(Recharge):
         Default is False.
     """
 
+    __slots__ = ()
+
     _option = 1
 
     def __init__(self, rate, concentration, save_budget=False):
@@ -106,6 +110,8 @@ class RechargeLayers(Recharge):
         Default is False.
     """
 
+    __slots__ = ()
+
     _option = 2
 
     _mapping = (("rech", "rate"), ("irch", "recharge_layer"))
@@ -143,6 +149,8 @@ class RechargeHighestActive(Recharge):
         Default is False.
     """
 
+    __slots__ = ()
+
     _option = 3
 
     def __init__(self, rate, concentration, save_budget=False):
@@ -26,6 +26,8 @@ class River(BoundaryCondition):
         Default is False.
     """
 
+    __slots__ = ()
+
     _pkg_id = "riv"
 
     _mapping = (
@@ -44,14 +46,22 @@ class River(BoundaryCondition):
         concentration=None,
         save_budget=False,
     ):
-        super().__init__()
-        self["stage"] = stage
-        self["conductance"] = conductance
-        self["bottom_elevation"] = bottom_elevation
-        self["density"] = density
-        if concentration is not None:
-            self["concentration"] = concentration
-        self["save_budget"] = save_budget
+        super().__init__(
+            {
+                "stage": stage,
+                "conductance": conductance,
+                "bottom_elevation": bottom_elevation,
+                "density": density,
+                "concentration": concentration,
+                "save_budget": save_budget,
+            }
+        )
+        # Align dask chunks once at construction, so the per-variable
+        # traversals in _render and save share one chunk structure.
+        if any(
+            self.dataset[var].chunks is not None for var in self.dataset.data_vars
+        ):
+            self.dataset = self.dataset.unify_chunks()
 
     def _pkgcheck(self, ibound=None):
         to_check = ["conductance", "density"]
@@ -1,6 +1,5 @@
 import pathlib
 
-import jinja2
 import pandas as pd
 
 from imod.wq.pkgbase import Package
@@ -173,16 +172,18 @@ class ParallelSolver(Package):
             for key in self._keywords.keys():
                 self._replace_keyword(d, key)
 
+        d["loadptr"] = ""
         if self["partition"] == "rcb":
-            d["load_balance_weight"] = self._compose_path(
+            path = self._compose_path(
                 {
                     "directory": directory,
                     "name": "load_balance_weight",
                     "extension": ".asc",
                 }
             )
+            d["loadptr"] = f"    loadptr = {path}\n"
 
-        return self._template.render(**d)
+        return self._template.format(**d)
 
     def save(self, directory):
         """
@@ -271,21 +272,21 @@ class ParallelKrylovFlowSolver(ParallelSolver):
     """
 
     _pkg_id = "pksf"
-    _template = jinja2.Template(
+    _template = (
         "[pksf]\n"
-        "    mxiter = {{max_iter}}\n"
-        "    innerit = {{inner_iter}}\n"
-        "    hclosepks = {{hclose}}\n"
-        "    rclosepks = {{rclose}}\n"
-        "    relax = {{relax}}\n"
-        "    h_fstrictpks = {{h_fstrict}}\n"
-        "    r_fstrictpks = {{r_fstrict}}\n"
-        "    partopt = {{partition}}\n"
-        "    isolver = {{solver}}\n"
-        "    npc = {{preconditioner}}\n"
-        "    npcdef = {{deflate}}\n"
-        "{% if load_balance_weight %}    loadptr = {{load_balance_weight}}\n{% endif %}"
-        "    pressakey = {{debug}}\n"
+        "    mxiter = {max_iter}\n"
+        "    innerit = {inner_iter}\n"
+        "    hclosepks = {hclose}\n"
+        "    rclosepks = {rclose}\n"
+        "    relax = {relax}\n"
+        "    h_fstrictpks = {h_fstrict}\n"
+        "    r_fstrictpks = {r_fstrict}\n"
+        "    partopt = {partition}\n"
+        "    isolver = {solver}\n"
+        "    npc = {preconditioner}\n"
+        "    npcdef = {deflate}\n"
+        "{loadptr}"
+        "    pressakey = {debug}"
     )
     _keywords = {
         "partition": {"uniform": 0, "rcb": 5},
@@ -399,17 +400,17 @@ class ParallelKrylovTransportSolver(ParallelSolver):
     """
 
     _pkg_id = "pkst"
-    _template = jinja2.Template(
+    _template = (
         "[pkst]\n"
-        "    mxiter = {{max_iter}}\n"
-        "    innerit = {{inner_iter}}\n"
-        "    cclosepks = {{cclose}}\n"
-        "    relax = {{relax}}\n"
-        "    partopt = {{partition}}\n"
-        "    isolver = {{solver}}\n"
-        "    npc = {{preconditioner}}\n"
-        "{% if load_balance_weight %}    loadptr = {{load_balance_weight}}\n{% endif %}"
-        "    pressakey = {{debug}}\n"
+        "    mxiter = {max_iter}\n"
+        "    innerit = {inner_iter}\n"
+        "    cclosepks = {cclose}\n"
+        "    relax = {relax}\n"
+        "    partopt = {partition}\n"
+        "    isolver = {solver}\n"
+        "    npc = {preconditioner}\n"
+        "{loadptr}"
+        "    pressakey = {debug}"
     )
 
     _keywords = {
@@ -12,6 +12,8 @@ class TimeVaryingConstantConcentration(BoundaryCondition):
     concentration: xr.DataArray of floats
     """
 
+    __slots__ = ()
+
     _pkg_id = "tvc"
 
     def __init__(self, concentration):
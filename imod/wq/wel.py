@@ -1,5 +1,6 @@
 from pathlib import Path
 
+import dask
 import jinja2
 import numpy as np
 
@@ -52,6 +53,8 @@ class Well(BoundaryCondition):
         Default is False.
     """
 
+    __slots__ = ()
+
     _pkg_id = "wel"
 
     _template = jinja2.Template(
@@ -204,12 +207,19 @@ class Well(BoundaryCondition):
         path = self._compose_path(d)
         df = df[columns]
         if "layer" in df:
+            # Every layer gets its own IPF and associated files: the writes
+            # are independent and I/O bound, so run them concurrently.
+            tasks = []
             for layer, layerdf in df.groupby("layer"):
                 # Ensure different IDs per layer are not overwritten.
                 layerdf["id"] = f"{name}_l{layer}/" + layerdf["id"].astype(str)
-                imod.ipf.save(
-                    path=path, df=layerdf, itype=itype, assoc_columns=assoc_columns
+                tasks.append(
+                    dask.delayed(imod.ipf.save)(
+                        path=path, df=layerdf, itype=itype, assoc_columns=assoc_columns
+                    )
                 )
+            # A no-op for an empty dataframe, which yields no groups.
+            dask.compute(tasks, scheduler="threads")
         else:
             imod.ipf.save(path=path, df=df, itype=itype, assoc_columns=assoc_columns)
 
@@ -229,16 +239,16 @@ class Well(BoundaryCondition):
         # Loop over species if applicable
         if "concentration" in self.dataset:
             for species in all_species:
-                if species is not None:
-                    ds = self.dataset.sel(species=species)
-                else:
-                    ds = self.dataset
-
-                df = ds.to_dataframe().rename(columns={"id_name": "id"})
                 name = "concentration"
                 if species is not None:
+                    ds = self.dataset.sel(species=species)
+                    species_df = ds.to_dataframe().rename(columns={"id_name": "id"})
                     name = f"{name}_c{species}"
-                self._save_layers(df, directory, name, "concentration")
+                else:
+                    # Without a species coordinate the dataframe is identical
+                    # to the one built for the rates above: reuse it.
+                    species_df = df
+                self._save_layers(species_df, directory, name, "concentration")
 
         return
 